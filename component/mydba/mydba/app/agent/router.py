@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from mydba.app.agent.base import BaseAgent, cleanup_decorator
-from mydba.app.config.agent import agent_config
+from mydba.app.config.agent import AgentInfo, agent_config
+from mydba.app.config.settings import settings
 from mydba.app.message.memory_history import MemoryInfo
 from mydba.app.message.message import Message
 from mydba.app.prompt import router
@@ -10,6 +11,29 @@ from mydba.common import stream
 from mydba.common.logger import logger
 from mydba.common.session import get_context
 
+# 系统提示词缓存，key 为提示词模版，value 为 (生成时使用的子 Agent 列表, 系统提示词)
+_system_prompt_cache: Dict[str, Tuple[Tuple[AgentInfo, ...], str]] = {}
+
+def _build_system_prompt(pattern: str, sub_agents: Tuple[AgentInfo, ...]) -> str:
+    """
+    构建路由型 Agent 的系统提示词，子 Agent 配置在运行期间不会变化，子 Agent 列表不变时直接复用结果
+    Args:
+        pattern (str): 系统提示词模版
+        sub_agents (tuple): 子 Agent 列表
+    Returns:
+        str: 系统提示词
+    """
+    cached = _system_prompt_cache.get(pattern)
+    if cached is not None and cached[0] is sub_agents:
+        return cached[1]
+    system_prompt = pattern.format(intent_infos=router.pack_intent_info(sub_agents),
+                                   default_intent=router.pack_default_intent(sub_agents),
+                                   intent_names=router.pack_intent_name(sub_agents),
+                                   conditions=router.pack_condition(sub_agents),
+                                   shots=router.pack_shot(sub_agents))
+    _system_prompt_cache[pattern] = (sub_agents, system_prompt)
+    return system_prompt
+
 class RouterAgent(BaseAgent, BaseModel):
     """
     路由型 Agent
@@ -31,7 +55,7 @@ class RouterAgent(BaseAgent, BaseModel):
             agent_info = sub_agents[0]
         else:
             # 意图识别，结合历史上下文
-            logger.info(f"[{self.name}] start to detect, query: {query}")
+            logger.info("[{}] start to detect, query: {}", self.name, query)
             intent = await self._predict_intent(query, context_memory)
             await stream.aprint(f"[A] 意图: {intent}")
             agent_info = agent_config.get_agent_by_intent(intent)
@@ -50,11 +74,10 @@ class RouterAgent(BaseAgent, BaseModel):
         Returns:
             str: The detected intent.
         """
-        messages = []
-        if context_memory:
-            for mem in context_memory:
-                messages.append(Message.user_message(mem.user_content))
-                messages.append(Message.assistant_message(mem.assistant_content))
+        # 系统提示词与历史记录在前、当前请求在后，且历史按时间顺序排列，保证可缓存的前缀连续
+        user_message, assistant_message = Message.user_message, Message.assistant_message
+        messages = [message for mem in (context_memory or ())
+                    for message in (user_message(mem.user_content), assistant_message(mem.assistant_content))]
         prompt = self._get_user_prompt(query)
         messages.append(Message.user_message(prompt))
         context = get_context()
@@ -62,27 +85,23 @@ class RouterAgent(BaseAgent, BaseModel):
             messages=messages,
             system_msgs=[self.system_message],
             stream=context.detail_info,
+            cache_system=settings.PROMPT_CACHE,
+            cache_history=settings.PROMPT_CACHE,
         )
-        logger.info(f"[{self.name}] detect intent, result: {content}")
+        logger.info("[{}] detect intent, result: {}", self.name, content)
         agent_info = agent_config.get_agent_by_intent(content)
         if agent_info is None:
-            logger.warning(f"[{self.name}] predict intent failed, using default agent, query: {query}, content: {content}")
+            logger.warning("[{}] predict intent failed, using default agent, query: {}, content: {}", self.name, query, content)
             agent_info = agent_config.get_default_agent()
             return agent_info.intent
         return content
 
     def _get_system_prompt(self) -> str:
-        system_prompt = self.prompt_patterns["system"]
-        sub_agent_list = agent_config.get_sub_agents()
-        system_prompt = system_prompt.format(intent_infos=router.pack_intent_info(sub_agent_list),
-                                             default_intent=router.pack_default_intent(sub_agent_list),
-                                             intent_names=router.pack_intent_name(sub_agent_list),
-                                             conditions=router.pack_condition(sub_agent_list),
-                                             shots=router.pack_shot(sub_agent_list))
-        logger.debug(f"[{self.name}] system prompt: {system_prompt}")
+        system_prompt = _build_system_prompt(self.prompt_patterns["system"], agent_config.get_sub_agents())
+        logger.debug("[{}] system prompt: {}", self.name, system_prompt)
         return system_prompt
 
     def _get_user_prompt(self, query: str) -> str:
         user_prompt = self.prompt_patterns["user"].format(query=query)
-        logger.debug(f"[{self.name}] user prompt: {user_prompt}")
+        logger.debug("[{}] user prompt: {}", self.name, user_prompt)
         return user_prompt
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 import json
 from enum import Enum
-from pydantic import BaseModel, Field
-from typing import List, Dict, Literal, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Dict, Literal, Optional, Tuple, Union
 
 class AgentMode(str, Enum):
     """定义工具调用的选择方式"""
@@ -37,6 +37,11 @@ class AgentInfo(BaseModel):
 class AgentConfig(BaseModel):
     agent_list: List[AgentInfo] = Field(default_factory=list, description="Agent 列表")
     config_map: Dict[str, AgentInfo] = Field(default_factory=dict, description="配置映射")
+    # 由 add_agent 维护的派生信息，不作为配置字段
+    _default_agent: Optional[AgentInfo] = PrivateAttr(default=None)
+    _main_agent: Optional[AgentInfo] = PrivateAttr(default=None)
+    # 子 Agent 列表，每次 add_agent 生成新的元组，调用方可据此判断配置是否变化
+    _sub_agents: Tuple[AgentInfo, ...] = PrivateAttr(default=())
 
     def add_agent(self, name: str, mode: str, intent: Optional[str] = None, 
                   intent_description: Optional[str] = None, prompts: Optional[str] = None, 
@@ -69,6 +74,12 @@ class AgentConfig(BaseModel):
         self.agent_list.append(agent_info)
         if intent:
             self.config_map[intent] = agent_info
+        if is_default and self._default_agent is None:
+            self._default_agent = agent_info
+        if is_main and self._main_agent is None:
+            self._main_agent = agent_info
+        if not is_main:
+            self._sub_agents = self._sub_agents + (agent_info,)
     
     def get_agent_by_intent(self, intent: str) -> Optional[AgentInfo]:
         """
@@ -86,7 +97,7 @@ class AgentConfig(BaseModel):
         Returns:
             AgentInfo: Agent 信息。
         """
-        return next(filter(lambda agent: agent.is_default, self.agent_list), None)
+        return self._default_agent
     
     def get_main_agent(self) -> Optional[AgentInfo]:
         """
@@ -94,13 +105,13 @@ class AgentConfig(BaseModel):
         Returns:
             AgentInfo: Agent 信息。
         """
-        return next(filter(lambda agent: agent.is_main, self.agent_list), None)
+        return self._main_agent
     
-    def get_sub_agents(self) -> List[AgentInfo]:
+    def get_sub_agents(self) -> Tuple[AgentInfo, ...]:
         """
         获取子 Agent。
         Returns:
-            List[AgentInfo]: 子 Agent 列表。
+            Tuple[AgentInfo, ...]: 子 Agent 列表。
         """
-        return list(filter(lambda agent: not agent.is_main, self.agent_list))
+        return self._sub_agents
 agent_config = AgentConfig()
@@ -12,7 +12,7 @@ async def load_config(conf_file: str='/usr/local/mydba/config_app.ini') -> None:
     """
     加载 MyDBA 配置信息，项目配置分为以下几类：
     1. 日志: 使用文件管理配置 (LOG_DIR, LOG_NAME, LOG_FILE_LEVEL)
-    2. 模型: 使用文件管理配置 (API_KEY, API_BASE_URL, LLM_MODEL, MAX_TOKENS, TEMPERATURE)
+    2. 模型: 使用文件管理配置 (API_KEY, API_BASE_URL, LLM_MODEL, MAX_TOKENS, TEMPERATURE, PROMPT_CACHE)
     3. App: 使用文件管理配置 (REFRESH_INTERVAL, MAX_STEPS, SECURITY_KEY)
     4. Mcp: 使用 sqlite 管理配置 (McpConfig)
     5. Agent: 使用 sqlite 管理配置 (AgentConfig)
@@ -124,7 +124,7 @@ def load_from_conf(conf_file: str) -> None:
     config_value = config.get('log', 'file_level')
     if config_value:
         common_settings.LOG_FILE_LEVEL = config_value
-    # 2. 模型配置 (API_KEY, API_BASE_URL, LLM_MODEL, MAX_TOKENS, TEMPERATURE)
+    # 2. 模型配置 (API_KEY, API_BASE_URL, LLM_MODEL, MAX_TOKENS, TEMPERATURE, PROMPT_CACHE)
     config_value = config.get('model', 'api_key')
     if config_value:
         app_settings.API_KEY = config_value
@@ -140,6 +140,9 @@ def load_from_conf(conf_file: str) -> None:
     config_value = config.get('model', 'temperature')
     if config_value:
         app_settings.TEMPERATURE = float(config_value)
+    config_value = config.get('model', 'prompt_cache', fallback='')
+    if config_value:
+        app_settings.PROMPT_CACHE = config_value == 'True'
     # 3. App 配置 (REFRESH_INTERVAL, MAX_STEPS, SECURITY_KEY)
     config_value = config.get('app', 'refresh_interval')
     if config_value:
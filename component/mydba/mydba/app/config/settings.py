@@ -15,6 +15,7 @@ class Settings:
         LLM_MODEL (str): 大模型名称。
         MAX_TOKENS (int): 大模型请求的最大 token 数量。
         TEMPERATURE (float): 大模型的温度。
+        PROMPT_CACHE (bool): 是否在请求中携带 cache_control 提示词缓存标记，仅在大模型服务支持时开启。
     """
     CONFIG_FILE = os.getenv("MYDBA_CONFIG_FILE", "/usr/local/mydba/config_app.ini")
     CONFIG_DATABASE = os.getenv("MYDBA_CONFIG_DATABASE", "sqlite:///usr/local/mydba/sqlite_app.db")
@@ -26,4 +27,5 @@ class Settings:
     LLM_MODEL = os.getenv("MYDBA_LLM_MODEL", "")
     MAX_TOKENS = int(os.getenv("MYDBA_MAX_TOKENS", "1000"))
     TEMPERATURE = float(os.getenv("MYDBA_TEMPERATURE", "1.0"))
+    PROMPT_CACHE = os.getenv("MYDBA_PROMPT_CACHE", "False") == "True"
 settings = Settings()
\ No newline at end of file
@@ -35,6 +35,20 @@ class LLM(BaseModel):
         for message in messages:
             formatted_messages.append(message.format())
         return formatted_messages
+
+    def format_system_messages(self, messages: List[Message], cache: bool = False) -> List[dict]:
+        """格式化系统消息列表，cache 为 True 时标记为可缓存的前缀，复用服务端的提示词缓存"""
+        formatted_messages = self.format_messages(messages)
+        if cache:
+            for message in formatted_messages:
+                self.mark_cache(message)
+        return formatted_messages
+
+    def mark_cache(self, message: dict) -> None:
+        """将格式化后的消息标记为缓存断点，服务端会缓存到该消息为止的前缀"""
+        if isinstance(message.get("content"), str) and message["content"]:
+            message["content"] = [{"type": "text", "text": message["content"],
+                                   "cache_control": {"type": "ephemeral"}}]
     
     def format_tools(self, tools: List[McpToolInfo]) -> List[dict]:
         """格式化工具列表"""
@@ -48,7 +62,9 @@ class LLM(BaseModel):
         messages: List[Message],
         system_msgs: Optional[List[Message]] = None,
         stream: bool = True,
-        timeout: int = 60
+        timeout: int = 60,
+        cache_system: bool = False,
+        cache_history: bool = False
     ) -> str:
         """
         发送请求到 LLM 并获取响应，不使用函数调用。
@@ -58,6 +74,8 @@ class LLM(BaseModel):
             system_msgs: 系统消息
             stream: 是否启用流式消息返回
             timeout: 请求超时时间
+            cache_system: 是否将系统消息标记为可缓存，适用于内容固定的系统提示词
+            cache_history: 是否在最后一条历史消息上设置缓存断点，要求 messages 的最后一条为本轮请求
         Returns:
             str: LLM 的响应内容
         Raises:
@@ -66,9 +84,11 @@ class LLM(BaseModel):
             Exception: 其他异常
         """
         try:
-            if system_msgs:
-                messages = system_msgs + messages
             messages = self.format_messages(messages)
+            if cache_history and len(messages) >= 2:
+                self.mark_cache(messages[-2])
+            if system_msgs:
+                messages = self.format_system_messages(system_msgs, cache_system) + messages
             if not stream:
                 response = await self.client.chat.completions.create(
                     model=self.model,
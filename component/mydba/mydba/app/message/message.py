@@ -3,7 +3,7 @@ import json
 from abc import ABC
 from enum import Enum
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, List, Optional, Union
 
 class Role(str, Enum):
@@ -14,6 +14,8 @@ class Role(str, Enum):
     TOOL = "tool"
 
 class Function(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="工具函数的名称")
     arguments: str = Field(..., description="工具函数的入参")
     def __repr__(self):
@@ -22,6 +24,8 @@ class Function(BaseModel):
         return json.dumps(self.model_dump(), ensure_ascii=False)
 
 class ToolCall(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="模型为本次调用分配的 id")
     type: str = Field(default="function", description="调用的类型，目前只有 function")
     function: Function = Field(..., description="模型需要调用的工具函数")
@@ -31,6 +35,8 @@ class ToolCall(BaseModel):
         return json.dumps(self.model_dump(), ensure_ascii=False)
 
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     role: str = Field(..., description="消息的角色")
     content: Optional[str] = Field(default=None, description="消息的内容")
     name: str = Field(None, description="用户名称")
@@ -3,9 +3,10 @@ import argparse
 import os
 import pwd
 import sys
+from functools import cached_property
 from pydantic import BaseModel, Field
 from tenacity import RetryError
-from typing import Optional, Tuple
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 from contextlib import asynccontextmanager
 from mydba.app.agent.base import BaseAgent
 from mydba.app.config.agent import agent_config
@@ -16,10 +17,35 @@ from mydba.common.logger import logger
 from mydba.common.session import get_context, set_context, reset_context, RequestContext
 from mydba.provider.base import BaseProvider
 
+QUIT_COMMANDS = frozenset({"/exit", "/quit", "/e", "/q"})
+DETAIL_INFO_COMMANDS = frozenset({"/i", "/info"})
+HELP_COMMANDS = frozenset({"/help", "/h", "/?", "/？"})
+
+# 固定的提示信息，预先拼接，每次只需一次输出
+WELCOME_USAGE = "\n".join([
+    "快捷命令:",
+    "输入 [/h] 或 [/?] 查看帮助",
+    "输入 [/e] 或 [/q] 退出助手",
+    "输入 [/i] 关闭或打开详细信息",
+    "输入 [/s session] 切换会话，默认 `default`",
+])
+UNKNOWN_COMMAND_USAGE = "\n".join([
+    "快捷命令有误",
+    "输入 [/h] 或 [/?] 查看帮助",
+    "输入 [/e] 或 [/q] 退出助手",
+    "输入 [/i] 关闭或打开详细信息",
+    "输入 [/s] 切换会话，默认 `default`",
+])
+
 class CommandLineProvider(BaseProvider, BaseModel):
     name: str = Field("CommandLine", description="名称")
     description: str = Field("通过命令行接入", description="描述")
 
+    def __init__(self, **data):
+        super().__init__(**data)
+        # 启动时计算请求标识，后续会话直接复用
+        self.get_request_info()
+
     async def run(self) -> None:
         await self._welcome_message()
         async with self._get_context() as context:
@@ -28,7 +54,7 @@ class CommandLineProvider(BaseProvider, BaseModel):
                 if query is None:
                     await stream.aprint("[A] 退出助手")
                     return
-                logger.info(f"[cmd] get user query: {query}")
+                logger.info("[cmd] get user query: {}", query)
                 agent = self._get_main_agent()
                 context_memory = await agent.get_history_memory()
                 has_error = True
@@ -59,6 +85,11 @@ class CommandLineProvider(BaseProvider, BaseModel):
         return args.s
     
     def get_request_info(self) -> str:
+        return self._request_info
+
+    @cached_property
+    def _request_info(self) -> str:
+        """终端和会话在进程生命周期内不变，只计算一次"""
         try:
             tty_name = os.ttyname(sys.stdin.fileno())
         except OSError:
@@ -67,15 +98,19 @@ class CommandLineProvider(BaseProvider, BaseModel):
         sid = os.getsid(os.getpid())
         return f'{tty_name}_{sid}'
     
+    @cached_property
+    def _llm(self) -> LLM:
+        """模型配置在进程生命周期内不变，复用同一个 LLM 实例"""
+        return LLM(model=settings.LLM_MODEL, base_url=settings.API_BASE_URL,
+                   api_key=settings.API_KEY, max_tokens=settings.MAX_TOKENS,
+                   temperature=settings.TEMPERATURE)
+
     def _get_main_agent(self) -> BaseAgent:
         main_agent_info = agent_config.get_main_agent()
         if main_agent_info is None:
             logger.error("[cmd] main agent not found")
             raise Exception("main agent not found")
-        llm = LLM(model=settings.LLM_MODEL, base_url=settings.API_BASE_URL,
-                  api_key=settings.API_KEY, max_tokens=settings.MAX_TOKENS,
-                  temperature=settings.TEMPERATURE)
-        return BaseAgent.create_agent(main_agent_info, llm)
+        return BaseAgent.create_agent(main_agent_info, self._llm)
     
     async def _get_query(self) -> Optional[str]:
         while True:
@@ -99,74 +134,56 @@ class CommandLineProvider(BaseProvider, BaseModel):
             bool: 是否继续输入
             str: 处理后的查询内容
         """
-        if not query.strip():
-            return True, None
-        if await self._handle_quit(query):
-            return False, None
-        if await self._handle_detail_info(query):
-            return True, None
-        if await self._handle_session(query):
+        q_stripped = query.strip()
+        if not q_stripped:
             return True, None
-        if await self._handle_help(query):
-            return True, None
-        return False, query.strip()
+        if not q_stripped.startswith('/'):
+            return False, q_stripped
+        q_lower = q_stripped.lower()
+        command = sys.intern(q_lower.split(" ", 1)[0])
+        handler = COMMAND_HANDLERS.get(command, CommandLineProvider._handle_unknown)
+        return await handler(self, q_lower)
     
-    async def _handle_quit(self, query: str) -> bool:
-        query = query.strip().lower()
-        if query in ["/exit", "/quit", "/e", "/q"]:
-            return True
-        return False
+    async def _handle_quit(self, query: str) -> Tuple[bool, Optional[str]]:
+        return False, None
     
-    async def _handle_detail_info(self, query: str) -> bool:
+    async def _handle_detail_info(self, query: str) -> Tuple[bool, Optional[str]]:
         context = get_context()
-        query = query.strip().lower()
-        if query in ["/i", "/info"]:
-            context.detail_info = not context.detail_info
-            if context.detail_info:
-                await stream.aprint(f"开启详细信息")
-            else:
-                await stream.aprint(f"关闭详细信息")
-            return True
-        return False
+        context.detail_info = not context.detail_info
+        if context.detail_info:
+            await stream.aprint(f"开启详细信息")
+        else:
+            await stream.aprint(f"关闭详细信息")
+        return True, None
     
-    async def _handle_session(self, query: str) -> bool:
-        query = query.strip().lower()
-        if query.startswith('/s ') or query == '/s':
-            items = query.split(" ")
-            session = next((s for s in items[1:] if s), None)
-            context = get_context()
-            if session:
-                await stream.aprint(f"切换会话: {session}")
-                context.session = session
-            else:
-                usage = f"当前会话: {context.session}\n切换方法: /s [session_name]"
-                await stream.aprint(f"{usage}")
-            return True
-        return False
+    async def _handle_session(self, query: str) -> Tuple[bool, Optional[str]]:
+        items = query.split(" ")
+        session = next((s for s in items[1:] if s), None)
+        context = get_context()
+        if session:
+            await stream.aprint(f"切换会话: {session}")
+            context.session = session
+        else:
+            usage = f"当前会话: {context.session}\n切换方法: /s [session_name]"
+            await stream.aprint(f"{usage}")
+        return True, None
     
-    async def _handle_help(self, query: str) -> bool:
-        query = query.strip().lower()
-        if query in ["/help", "/h", "/?", "/？"]:
-            await self._welcome_message()
-            return True
-        if query.startswith('/'):
-            await stream.aprint("快捷命令有误")
-            await stream.aprint("输入 [/h] 或 [/?] 查看帮助")
-            await stream.aprint("输入 [/e] 或 [/q] 退出助手")
-            await stream.aprint("输入 [/i] 关闭或打开详细信息")
-            await stream.aprint("输入 [/s] 切换会话，默认 `default`")
-            return True
-        return False
+    async def _handle_help(self, query: str) -> Tuple[bool, Optional[str]]:
+        await self._welcome_message()
+        return True, None
+
+    async def _handle_unknown(self, query: str) -> Tuple[bool, Optional[str]]:
+        await stream.aprint(UNKNOWN_COMMAND_USAGE)
+        return True, None
     
+    @cached_property
+    def _welcome_str(self) -> str:
+        """欢迎信息，agent 配置在启动时加载，只需拼接一次"""
+        functions = "、".join(agent.intent for agent in agent_config.agent_list if not agent.is_main and not agent.is_default)
+        return f"欢迎使用阿里云数据库智能助手 MyDBA\n我能帮您：{functions}\n{WELCOME_USAGE}"
+
     async def _welcome_message(self) -> None:
-        functions = "、".join([agent.intent for agent in filter(lambda agent: not agent.is_main and not agent.is_default, agent_config.agent_list)])
-        await stream.aprint("欢迎使用阿里云数据库智能助手 MyDBA")
-        await stream.aprint(f"我能帮您：{functions}")
-        await stream.aprint("快捷命令:")
-        await stream.aprint("输入 [/h] 或 [/?] 查看帮助")
-        await stream.aprint("输入 [/e] 或 [/q] 退出助手")
-        await stream.aprint("输入 [/i] 关闭或打开详细信息")
-        await stream.aprint("输入 [/s session] 切换会话，默认 `default`")
+        await stream.aprint(self._welcome_str)
 
     async def _send_response(self, content: str) -> None:
         await stream.aprint(f"[A] 查询结果: \n{content}")
@@ -180,3 +197,11 @@ class CommandLineProvider(BaseProvider, BaseModel):
         token = set_context(context)
         yield context
         reset_context(token)
+
+# 快捷命令分发表，key 为命令的第一个词，value 返回 (是否继续输入, 处理后的查询内容)
+COMMAND_HANDLERS: Dict[str, Callable[[CommandLineProvider, str], Awaitable[Tuple[bool, Optional[str]]]]] = {
+    **dict.fromkeys(QUIT_COMMANDS, CommandLineProvider._handle_quit),
+    **dict.fromkeys(DETAIL_INFO_COMMANDS, CommandLineProvider._handle_detail_info),
+    **dict.fromkeys(HELP_COMMANDS, CommandLineProvider._handle_help),
+    "/s": CommandLineProvider._handle_session,
+}
@@ -50,8 +50,12 @@ class RdsMCP(FastMCP):
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initializes the engine with an internal list for pending registrations."""
-        self._pending_registrations: List[_RegistrableItem] = []
+        """Initializes the engine with an internal registry of pending registrations.
+
+        Pending items are indexed by group, then by (item type, effective name),
+        so cataloging is O(1) and each group keeps its definition order.
+        """
+        self._pending_registrations: Dict[str, Dict[Tuple[_ComponentType, str], _RegistrableItem]] = {}
         self._is_activated = False
         super().__init__(*args, **kwargs)
         set_mcp_instance(self)
@@ -72,7 +76,7 @@ class RdsMCP(FastMCP):
                 func=func, group=group, item_type=_ComponentType.TOOL,
                 args=(), kwargs={}
             )
-            self._pending_registrations.append(item)
+            self._add_pending(item)
             return func
 
         #Decorator used with parentheses, e.g., @mcp.tool(group='db')
@@ -81,7 +85,7 @@ class RdsMCP(FastMCP):
                 func=fn, group=group, item_type=_ComponentType.TOOL,
                 args=dargs, kwargs=dkwargs
             )
-            self._pending_registrations.append(item)
+            self._add_pending(item)
             return fn
 
         return decorator
@@ -93,7 +97,7 @@ class RdsMCP(FastMCP):
                 func=func, group=group, item_type=_ComponentType.PROMPT,
                 args=(), kwargs={}
             )
-            self._pending_registrations.append(item)
+            self._add_pending(item)
             return func
 
         def decorator(fn: Callable) -> Callable:
@@ -101,11 +105,21 @@ class RdsMCP(FastMCP):
                 func=fn, group=group, item_type=_ComponentType.PROMPT,
                 args=dargs, kwargs=dkwargs
             )
-            self._pending_registrations.append(item)
+            self._add_pending(item)
             return fn
 
         return decorator
 
+    def _add_pending(self, item: _RegistrableItem) -> None:
+        """Catalogs an item under its group. The first definition of a name in a group wins."""
+        name = item.kwargs.get('name', item.func.__name__)
+        group_items = self._pending_registrations.setdefault(item.group, {})
+        key = (item.item_type, name)
+        if key in group_items:
+            print(f"Warning: {item.item_type.value} '{name}' already exists in group '{item.group}'. Ignoring duplicate definition.")
+            return
+        group_items[key] = item
+
     def activate(self, enabled_groups: list[str]) -> None:
         """
         Finalizes the setup by activating all deferred components.
@@ -118,8 +132,9 @@ class RdsMCP(FastMCP):
         print(f"\n--- Activating Component Groups: {enabled_groups} ---")
 
         activated_items: List[_RegistrableItem] = []
-        for item in self._pending_registrations:
-            if item.group in enabled_groups:
+        # Only walk the enabled groups; dict.fromkeys drops duplicates while keeping order.
+        for group in dict.fromkeys(enabled_groups):
+            for item in self._pending_registrations[group].values():
                 print(f"Activating {item.item_type.value} '{item.func.__name__}' from group '{item.group}'...")
 
                 final_kwargs = item.kwargs.copy()
@@ -143,7 +158,7 @@ class RdsMCP(FastMCP):
 
     def _validate_groups(self, enabled_groups: list[str]) -> None:
         """Checks if all requested groups are valid before activation."""
-        all_defined_groups = {item.group for item in self._pending_registrations}
+        all_defined_groups = set(self._pending_registrations)
         invalid_groups = set(enabled_groups) - all_defined_groups
         if invalid_groups:
             raise ValueError(
@@ -154,7 +169,7 @@ class RdsMCP(FastMCP):
     def _run_debug_output(self, enabled_groups: list[str], activated_items: list[_RegistrableItem]):
         """Prints debug information for all component types if the env var is set."""
         if os.getenv('TOOLSET_DEBUG', '').lower() in ('1', 'true', 'yes', 'on'):
-            all_groups = sorted(list({item.group for item in self._pending_registrations}))
+            all_groups = sorted(self._pending_registrations)
 
             print("\n--- COMPONENT DEBUG OUTPUT ---")
             print(f"All defined groups: {all_groups}")
@@ -143,3 +143,44 @@ def test_activate_should_succeed_gracefully_when_activating_an_empty_group(mcp_i
         pytest.fail("activate() raised ValueError unexpectedly for a valid, non-empty group.")
     assert mcp.add_tool.call_count == 1
     mcp.add_tool.assert_called_once_with(my_tool, name='my_tool')
+
+
+def test_activate_should_register_a_function_under_each_name_it_is_defined_with(mcp_instance: RdsMCP):
+    """
+    Tests that the same function defined under two names in one group is
+    activated once per name.
+    """
+    mcp = mcp_instance
+
+    def my_tool():
+        pass
+
+    mcp.tool(group='group_a', name='tool_a')(my_tool)
+    mcp.tool(group='group_a', name='tool_b')(my_tool)
+
+    mcp.activate(enabled_groups=['group_a'])
+
+    assert mcp.add_tool.call_count == 2
+    mcp.add_tool.assert_any_call(my_tool, name='tool_a')
+    mcp.add_tool.assert_any_call(my_tool, name='tool_b')
+
+
+def test_activate_should_keep_the_first_definition_when_a_name_is_defined_twice_in_a_group(mcp_instance: RdsMCP):
+    """
+    Tests that a second definition with an existing name in the same group
+    is ignored, matching FastMCP's first-wins behavior for duplicate tools.
+    """
+    mcp = mcp_instance
+
+    def first_tool():
+        pass
+
+    def second_tool():
+        pass
+
+    mcp.tool(group='group_a', name='my_tool')(first_tool)
+    mcp.tool(group='group_a', name='my_tool')(second_tool)
+
+    mcp.activate(enabled_groups=['group_a'])
+
+    mcp.add_tool.assert_called_once_with(first_tool, name='my_tool')